@@ -1,4 +1,5 @@
 from logging.config import fileConfig
+import re
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
@@ -12,12 +13,28 @@ config = context.config
 # Override with the actual database URL from the config
 config.set_main_option("sqlalchemy.url", "postgresql://ffliq_user:ffliq_pass@db:5432/ffliq")
 
-# Interpret the config file for Python logging
-fileConfig(config.config_file_name)
+# Interpret the config file for Python logging; keep the app's loggers enabled
+# when migrations run in-process (e.g. from the test suite)
+fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # Add your model's MetaData object here
 target_metadata = Base.metadata
 
+# Season partitions (<table>_<season>, <table>_default) of partitioned tables are
+# managed by app/db/partitions.py and aren't in the metadata; autogenerate must
+# not propose dropping them.
+PARTITIONED_TABLES = [
+    table.name for table in target_metadata.sorted_tables
+    if table.dialect_options["postgresql"].get("partition_by")
+]
+PARTITION_NAME = re.compile(rf"^({'|'.join(PARTITIONED_TABLES)})_(\d+|default)$")
+
+def include_name(name, type_, parent_names) -> bool:
+    """Skip season partitions when comparing the database with the models."""
+    if type_ == "table":
+        return not PARTITION_NAME.match(name)
+    return True
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -26,6 +43,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -33,6 +51,16 @@ def run_migrations_offline() -> None:
 
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
+    # A connection can be passed in programmatically (e.g. by the test suite)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection, target_metadata=target_metadata, include_name=include_name
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
@@ -41,7 +69,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_name=include_name
         )
 
         with context.begin_transaction():
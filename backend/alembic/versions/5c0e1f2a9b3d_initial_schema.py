@@ -0,0 +1,186 @@
+"""Initial schema for all database tables.
+
+Revision ID: 5c0e1f2a9b3d
+Create Date: 2025-05-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '5c0e1f2a9b3d'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Normalized stat columns shared by player_stats and player_projections
+STAT_COLUMNS = [
+    ('passing_yards', sa.Float), ('passing_tds', sa.Integer), ('interceptions', sa.Integer),
+    ('passing_completions', sa.Integer), ('passing_attempts', sa.Integer),
+    ('rushing_yards', sa.Float), ('rushing_tds', sa.Integer), ('rushing_attempts', sa.Integer),
+    ('receiving_yards', sa.Float), ('receiving_tds', sa.Integer), ('receptions', sa.Integer),
+    ('targets', sa.Integer), ('fumbles_lost', sa.Integer),
+]
+
+# Kicking and defense columns only tracked for actual stats
+EXTRA_STAT_COLUMNS = [
+    ('fg_made_1_29', sa.Integer), ('fg_made_30_39', sa.Integer), ('fg_made_40_49', sa.Integer),
+    ('fg_made_50_plus', sa.Integer), ('extra_points_made', sa.Integer),
+    ('sacks', sa.Float), ('defensive_interceptions', sa.Integer), ('fumble_recoveries', sa.Integer),
+    ('defensive_tds', sa.Integer), ('safeties', sa.Integer),
+]
+
+
+def _timestamps():
+    return [
+        sa.Column('created_at', sa.DateTime, nullable=False),
+        sa.Column('updated_at', sa.DateTime, nullable=False),
+    ]
+
+
+def _indexes(table, columns):
+    for column in columns:
+        op.create_index(f'ix_{table}_{column}', table, [column])
+
+
+def upgrade():
+    op.create_table(
+        'nfl_players',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('name', sa.String, nullable=False),
+        sa.Column('position', sa.String, nullable=False),
+        sa.Column('nfl_team', sa.String, nullable=False),
+        sa.Column('jersey_number', sa.Integer, nullable=True),
+        sa.Column('headshot_url', sa.String, nullable=True),
+        sa.Column('global_player_id', sa.String, unique=True, nullable=False),
+        sa.Column('provider_player_ids', sa.JSON, nullable=True),
+        sa.Column('active_flag', sa.Boolean, nullable=False),
+        sa.Column('season_year', sa.Integer, nullable=False),
+        sa.Column('status', sa.String, nullable=True),
+    )
+    _indexes('nfl_players', ['id', 'position', 'nfl_team', 'season_year'])
+
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('username', sa.String, unique=True, nullable=False),
+        sa.Column('email', sa.String, unique=True, nullable=False),
+        sa.Column('hashed_password', sa.String, nullable=False),
+        sa.Column('provider_credentials', sa.JSON, nullable=True),
+        *_timestamps(),
+    )
+    _indexes('users', ['id'])
+
+    op.create_table(
+        'leagues',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('name', sa.String, nullable=False),
+        sa.Column('description', sa.Text, nullable=True),
+        sa.Column('season_year', sa.Integer, nullable=False),
+        sa.Column('provider_id', sa.Integer, nullable=True),
+        sa.Column('provider_league_id', sa.String, nullable=True),
+        sa.Column('settings', sa.JSON, nullable=True),
+        sa.Column('settings_source', sa.String, nullable=True),
+        sa.Column('last_sync_time', sa.DateTime, nullable=True),
+        sa.Column('sync_frequency', sa.Integer, nullable=True),
+        sa.Column('status', sa.String, nullable=False),
+        sa.Column('created_by_id', sa.Integer, sa.ForeignKey('users.id')),
+        *_timestamps(),
+    )
+    _indexes('leagues', ['id', 'season_year'])
+
+    op.create_table(
+        'teams',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('name', sa.String, nullable=False),
+        sa.Column('user_id', sa.Integer, sa.ForeignKey('users.id')),
+        sa.Column('league_id', sa.Integer, sa.ForeignKey('leagues.id')),
+        sa.Column('provider_team_id', sa.String, nullable=True),
+        sa.Column('logo_url', sa.String, nullable=True),
+        *_timestamps(),
+    )
+    _indexes('teams', ['id'])
+
+    op.create_table(
+        'rosters',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('team_id', sa.Integer, sa.ForeignKey('teams.id'), nullable=False),
+        sa.Column('nfl_player_id', sa.Integer, sa.ForeignKey('nfl_players.id'), nullable=False),
+        sa.Column('roster_position', sa.String, nullable=False),
+        sa.Column('week_number', sa.Integer, nullable=False),
+        sa.Column('is_starter', sa.Boolean, nullable=False),
+        sa.Column('provider_roster_slot_id', sa.String, nullable=True),
+        sa.Column('last_updated', sa.DateTime, nullable=False),
+    )
+    _indexes('rosters', ['id', 'week_number'])
+
+    op.create_table(
+        'game_schedules',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('nfl_team_home', sa.String, nullable=False),
+        sa.Column('nfl_team_away', sa.String, nullable=False),
+        sa.Column('week_number', sa.Integer, nullable=False),
+        sa.Column('season_year', sa.Integer, nullable=False),
+        sa.Column('game_time', sa.DateTime, nullable=False),
+        sa.Column('status', sa.String, nullable=False),
+    )
+    _indexes('game_schedules', ['id', 'nfl_team_home', 'nfl_team_away', 'week_number', 'season_year'])
+
+    op.create_table(
+        'player_stats',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('nfl_player_id', sa.Integer, sa.ForeignKey('nfl_players.id'), nullable=False),
+        sa.Column('week_number', sa.Integer, nullable=False),
+        sa.Column('season_year', sa.Integer, nullable=False),
+        *[sa.Column(name, type_) for name, type_ in STAT_COLUMNS + EXTRA_STAT_COLUMNS],
+        sa.Column('provider_id', sa.String, nullable=True),
+        sa.Column('raw_stats', sa.JSON, nullable=True),
+        sa.Column('last_updated', sa.DateTime),
+    )
+    _indexes('player_stats', ['id', 'week_number', 'season_year'])
+
+    op.create_table(
+        'player_projections',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('nfl_player_id', sa.Integer, sa.ForeignKey('nfl_players.id'), nullable=False),
+        sa.Column('week_number', sa.Integer, nullable=False),
+        sa.Column('season_year', sa.Integer, nullable=False),
+        *[sa.Column(name, type_) for name, type_ in STAT_COLUMNS],
+        sa.Column('projection_source', sa.String, nullable=False),
+        sa.Column('projection_data', sa.JSON, nullable=True),
+        sa.Column('created_at', sa.DateTime),
+    )
+    _indexes('player_projections', ['id', 'week_number', 'season_year'])
+
+    op.create_table(
+        'player_points',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('nfl_player_id', sa.Integer, sa.ForeignKey('nfl_players.id'), nullable=False),
+        sa.Column('league_id', sa.Integer, sa.ForeignKey('leagues.id'), nullable=False),
+        sa.Column('week_number', sa.Integer, nullable=False),
+        sa.Column('season_year', sa.Integer, nullable=False),
+        sa.Column('points', sa.Float, nullable=False),
+        sa.Column('calculated_at', sa.DateTime),
+    )
+    _indexes('player_points', ['id', 'week_number', 'season_year'])
+
+    op.create_table(
+        'player_news',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('nfl_player_id', sa.Integer, sa.ForeignKey('nfl_players.id'), nullable=False),
+        sa.Column('title', sa.String, nullable=False),
+        sa.Column('content', sa.Text, nullable=False),
+        sa.Column('source', sa.String, nullable=True),
+        sa.Column('source_url', sa.String, nullable=True),
+        sa.Column('published_at', sa.DateTime, nullable=False),
+        sa.Column('sentiment_score', sa.Float, nullable=True),
+    )
+    _indexes('player_news', ['id'])
+
+
+def downgrade():
+    for table in [
+        'player_news', 'player_points', 'player_projections', 'player_stats',
+        'game_schedules', 'rosters', 'teams', 'leagues', 'users', 'nfl_players',
+    ]:
+        op.drop_table(table)
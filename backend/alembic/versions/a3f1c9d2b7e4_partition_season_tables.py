@@ -0,0 +1,82 @@
+"""Partition stats, projections and points by season_year.
+
+Revision ID: a3f1c9d2b7e4
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'a3f1c9d2b7e4'
+down_revision = '5c0e1f2a9b3d'
+branch_labels = None
+depends_on = None
+
+# Table -> foreign keys as (column, referenced table)
+TABLES = {
+    'player_stats': [('nfl_player_id', 'nfl_players')],
+    'player_projections': [('nfl_player_id', 'nfl_players')],
+    'player_points': [('nfl_player_id', 'nfl_players'), ('league_id', 'leagues')],
+}
+
+INDEXED_COLUMNS = ['id', 'week_number', 'season_year']
+
+
+def _rebuild(table, partitioned):
+    """
+    Recreate a table as a partitioned (or plain) table and copy its rows.
+
+    The id sequence is kept so existing IDs and nextval() stay valid.
+    """
+    conn = op.get_bind()
+    new_table = f'{table}_new'
+
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY NONE')
+    op.execute(
+        f'CREATE TABLE {new_table} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        + (' PARTITION BY LIST (season_year)' if partitioned else '')
+    )
+    if partitioned:
+        seasons = conn.execute(sa.text(f'SELECT DISTINCT season_year FROM {table}')).scalars()
+        for season_year in seasons:
+            op.execute(
+                f'CREATE TABLE {table}_{season_year} PARTITION OF {new_table} '
+                f'FOR VALUES IN ({season_year})'
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {new_table} DEFAULT')
+
+    op.execute(f'INSERT INTO {new_table} SELECT * FROM {table}')
+    op.drop_table(table)
+    op.rename_table(new_table, table)
+
+    op.create_primary_key(
+        f'{table}_pkey', table, ['id', 'season_year'] if partitioned else ['id']
+    )
+    for column, referenced in TABLES[table]:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, referenced, [column], ['id']
+        )
+    for column in INDEXED_COLUMNS:
+        op.create_index(f'ix_{table}_{column}', table, [column])
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+
+
+def upgrade():
+    for table in TABLES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade():
+    # Detached seasons would silently be left out of the rebuilt tables
+    archived = op.get_bind().execute(sa.text(
+        "SELECT table_name FROM information_schema.tables WHERE table_schema = 'archive'"
+    )).scalars().all()
+    archived = sorted(name for name in archived if name.rsplit('_', 1)[0] in TABLES)
+    if archived:
+        raise RuntimeError(
+            f'Archived season partitions exist ({", ".join(archived)}); restore them with '
+            f'"python -m app.db.partitions restore <season_year>" before downgrading'
+        )
+    for table in TABLES:
+        _rebuild(table, partitioned=False)
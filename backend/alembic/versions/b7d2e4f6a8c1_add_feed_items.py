@@ -0,0 +1,43 @@
+"""Add feed_items for the roster-aware user feed.
+
+Revision ID: b7d2e4f6a8c1
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'b7d2e4f6a8c1'
+down_revision = 'a3f1c9d2b7e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'feed_items',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('user_id', sa.Integer, sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('item_type', sa.String, nullable=False),
+        sa.Column('nfl_player_id', sa.Integer, sa.ForeignKey('nfl_players.id'), nullable=False),
+        sa.Column('team_id', sa.Integer, sa.ForeignKey('teams.id'), nullable=True),
+        sa.Column('player_news_id', sa.Integer, sa.ForeignKey('player_news.id'), nullable=True),
+        sa.Column('week_number', sa.Integer, nullable=True),
+        sa.Column('alert_kind', sa.String, nullable=True),
+        sa.Column('title', sa.String, nullable=False),
+        sa.Column('content', sa.Text, nullable=True),
+        sa.Column('published_at', sa.DateTime, nullable=False),
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('user_id', 'player_news_id', name='uq_feed_items_user_news'),
+        sa.UniqueConstraint(
+            'user_id', 'item_type', 'team_id', 'nfl_player_id', 'week_number', 'alert_kind',
+            name='uq_feed_items_user_alert',
+        ),
+    )
+    op.create_index('ix_feed_items_user_id_id', 'feed_items', ['user_id', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_feed_items_user_id_id', table_name='feed_items')
+    op.drop_table('feed_items')
@@ -29,6 +29,12 @@ class Settings(BaseSettings):
     DEBUG: bool = Field(default=False)
     API_PREFIX: str = "/api"
     
+    # Live game-day settings
+    LIVE_STATS_POLL_INTERVAL: int = Field(default=60)  # in seconds
+    
+    # Feed settings
+    FEED_MAX_ITEMS: int = Field(default=500)  # newest items kept per user
+    
     # AI settings
     OPENAI_API_KEY: Optional[str] = None
     USE_LOCAL_LLM: bool = Field(default=True)
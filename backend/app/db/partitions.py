@@ -0,0 +1,179 @@
+"""
+Season partition management for FFLIQ backend.
+
+`player_stats`, `player_projections` and `player_points` are list-partitioned by
+`season_year` so current-season queries and vacuums only touch one partition.
+This module creates partitions for new seasons, compacts superseded projection
+rows and archives old seasons by detaching their partitions.
+
+Usage:
+    python -m app.db.partitions create 2026
+    python -m app.db.partitions compact 2025
+    python -m app.db.partitions archive 2021
+"""
+from typing import List
+import argparse
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db_context
+
+logger = logging.getLogger(__name__)
+
+# Tables partitioned by season_year
+PARTITIONED_TABLES: List[str] = ["player_stats", "player_projections", "player_points"]
+
+# Schema that archived season partitions are moved to
+ARCHIVE_SCHEMA = "archive"
+
+
+def partition_name(table: str, season_year: int) -> str:
+    """Return the name of the partition holding one season of a table."""
+    return f"{table}_{int(season_year)}"
+
+
+def _table_exists(db: Session, qualified_name: str) -> bool:
+    return db.execute(text("SELECT to_regclass(:name)"), {"name": qualified_name}).scalar() is not None
+
+
+def _is_archived(db: Session, season_year: int) -> bool:
+    """Return True if any partition of the season sits in the archive schema."""
+    return any(
+        _table_exists(db, f"{ARCHIVE_SCHEMA}.{partition_name(table, season_year)}")
+        for table in PARTITIONED_TABLES
+    )
+
+
+def _attach_season(db: Session, table: str, season_year: int, attach_sql: str) -> None:
+    """
+    Add a season partition to a table via `attach_sql`.
+
+    Rows of the season that landed in `<table>_default` meanwhile are moved into
+    the partition. The default partition is detached while doing so, since
+    Postgres rejects a season partition whose rows sit in the default partition.
+    """
+    name = partition_name(table, season_year)
+    default = f"{table}_default"
+    db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+    db.execute(text(attach_sql))
+    db.execute(text(
+        f"INSERT INTO {name} SELECT * FROM {default} WHERE season_year = {season_year}"
+    ))
+    db.execute(text(f"DELETE FROM {default} WHERE season_year = {season_year}"))
+    db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+
+
+def create_season_partitions(db: Session, season_year: int) -> None:
+    """
+    Create the partitions for a season if they don't exist yet.
+
+    Rows of the season already in `<table>_default` (e.g. an early projection
+    import) are moved into the new partition. Archived seasons are refused;
+    use `restore_season` for them.
+    """
+    season_year = int(season_year)
+    if _is_archived(db, season_year):
+        raise ValueError(f"Season {season_year} is archived; restore it instead")
+    for table in PARTITIONED_TABLES:
+        name = partition_name(table, season_year)
+        if _table_exists(db, f"public.{name}"):
+            continue
+        _attach_season(
+            db, table, season_year,
+            f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES IN ({season_year})",
+        )
+    db.commit()
+    logger.info("Created partitions for season %d", season_year)
+
+
+def compact_projections(db: Session, season_year: int) -> int:
+    """
+    Delete superseded projection rows for a season.
+
+    Only the latest projection per player, week and source is kept.
+    Returns the number of deleted rows.
+    """
+    result = db.execute(
+        text(
+            """
+            DELETE FROM player_projections p
+            USING (
+                SELECT id FROM (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY nfl_player_id, week_number, projection_source
+                        ORDER BY created_at DESC NULLS LAST, id DESC
+                    ) AS rn
+                    FROM player_projections
+                    WHERE season_year = :season_year
+                ) ranked
+                WHERE ranked.rn > 1
+            ) superseded
+            WHERE p.season_year = :season_year AND p.id = superseded.id
+            """
+        ),
+        {"season_year": season_year},
+    )
+    db.commit()
+    logger.info("Compacted %d projection rows for season %d", result.rowcount, season_year)
+    return result.rowcount
+
+
+def archive_season(db: Session, season_year: int) -> None:
+    """
+    Detach a season's partitions and move them to the archive schema.
+
+    The archived tables can then be dumped and dropped, or re-attached with
+    `restore_season`.
+    """
+    db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+    for table in PARTITIONED_TABLES:
+        name = partition_name(table, season_year)
+        db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+    db.commit()
+    logger.info("Archived season %d", season_year)
+
+
+def restore_season(db: Session, season_year: int) -> None:
+    """
+    Move an archived season back and re-attach its partitions.
+
+    Rows written for the season while it was archived (they land in
+    `<table>_default`) are moved into the restored partitions.
+    """
+    season_year = int(season_year)
+    for table in PARTITIONED_TABLES:
+        name = partition_name(table, season_year)
+        db.execute(text(f"ALTER TABLE {ARCHIVE_SCHEMA}.{name} SET SCHEMA public"))
+        _attach_season(
+            db, table, season_year,
+            f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES IN ({season_year})",
+        )
+    db.commit()
+    logger.info("Restored season %d", season_year)
+
+
+COMMANDS = {
+    "create": create_season_partitions,
+    "compact": compact_projections,
+    "archive": archive_season,
+    "restore": restore_season,
+}
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Manage season partitions")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("season_year", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with get_db_context() as db:
+        COMMANDS[args.command](db, args.season_year)
+
+
+if __name__ == "__main__":
+    main()
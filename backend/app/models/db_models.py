@@ -4,7 +4,7 @@ Includes all models as defined in PLANNING.md with proper relationships and fiel
 """
 from sqlalchemy import (
     Column, Integer, String, ForeignKey, Boolean, DateTime, 
-    Float, JSON, Table, Enum, Text, func
+    Float, JSON, Table, Enum, Text, Index, UniqueConstraint, func
 )
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.ext.declarative import declared_attr
@@ -25,6 +25,11 @@ class StatusEnum(str, enum.Enum):
     COMPLETED = "completed"
     SCHEDULED = "scheduled"
 
+class FeedItemTypeEnum(str, enum.Enum):
+    """Kinds of items in a user's feed."""
+    NEWS = "news"
+    ROSTER_ALERT = "roster_alert"
+
 class NFLPlayer(Base):
     """
     Master list of NFL players (single source of truth).
@@ -67,6 +72,7 @@ class User(TimestampMixin, Base):
     # Relationships
     leagues_created = relationship("League", back_populates="created_by")
     teams = relationship("Team", back_populates="user")
+    feed_items = relationship("FeedItem", back_populates="user")
 
 class League(TimestampMixin, Base):
     """
@@ -162,13 +168,16 @@ class GameSchedule(Base):
 class PlayerStats(Base):
     """
     Actual player performance statistics.
+    Partitioned by season_year (see app/db/partitions.py).
     """
     __tablename__ = "player_stats"
+    __table_args__ = {"postgresql_partition_by": "LIST (season_year)"}
     
-    id = Column(Integer, primary_key=True, index=True)
+    # The partition key must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     nfl_player_id = Column(Integer, ForeignKey("nfl_players.id"), nullable=False)
     week_number = Column(Integer, nullable=False, index=True)
-    season_year = Column(Integer, nullable=False, index=True)
+    season_year = Column(Integer, primary_key=True, index=True)
     
     # Normalized stat fields for fantasy scoring
     # Passing stats
@@ -217,13 +226,16 @@ class PlayerStats(Base):
 class PlayerProjection(Base):
     """
     Projected player performance.
+    Partitioned by season_year (see app/db/partitions.py).
     """
     __tablename__ = "player_projections"
+    __table_args__ = {"postgresql_partition_by": "LIST (season_year)"}
     
-    id = Column(Integer, primary_key=True, index=True)
+    # The partition key must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     nfl_player_id = Column(Integer, ForeignKey("nfl_players.id"), nullable=False)
     week_number = Column(Integer, nullable=False, index=True)
-    season_year = Column(Integer, nullable=False, index=True)
+    season_year = Column(Integer, primary_key=True, index=True)
     
     # Same normalized stat fields as PlayerStats
     # Passing stats
@@ -258,14 +270,17 @@ class PlayerProjection(Base):
 class PlayerPoints(Base):
     """
     Cached calculated fantasy points.
+    Partitioned by season_year (see app/db/partitions.py).
     """
     __tablename__ = "player_points"
+    __table_args__ = {"postgresql_partition_by": "LIST (season_year)"}
     
-    id = Column(Integer, primary_key=True, index=True)
+    # The partition key must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     nfl_player_id = Column(Integer, ForeignKey("nfl_players.id"), nullable=False)
     league_id = Column(Integer, ForeignKey("leagues.id"), nullable=False)
     week_number = Column(Integer, nullable=False, index=True)
-    season_year = Column(Integer, nullable=False, index=True)
+    season_year = Column(Integer, primary_key=True, index=True)
     points = Column(Float, nullable=False)
     calculated_at = Column(DateTime, default=func.now())
 
@@ -285,4 +300,41 @@ class PlayerNews(Base):
     sentiment_score = Column(Float, nullable=True)  # Optional, for AI analysis
     
     # Relationships
-    player = relationship("NFLPlayer", back_populates="news")
\ No newline at end of file
+    player = relationship("NFLPlayer", back_populates="news")
+
+class FeedItem(Base):
+    """
+    Precomputed per-user feed entry (news or roster alert).
+    Written by fan-out when news or alerts are published, so reading a feed
+    is a range read on (user_id, id).
+    """
+    __tablename__ = "feed_items"
+    __table_args__ = (
+        Index("ix_feed_items_user_id_id", "user_id", "id"),
+        # Republishing the same news or alert must not duplicate feed items
+        UniqueConstraint("user_id", "player_news_id", name="uq_feed_items_user_news"),
+        UniqueConstraint(
+            "user_id", "item_type", "team_id", "nfl_player_id", "week_number", "alert_kind",
+            name="uq_feed_items_user_alert",
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    item_type = Column(String, nullable=False)  # news, roster_alert
+    
+    # Source of the item
+    nfl_player_id = Column(Integer, ForeignKey("nfl_players.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)  # Set for roster alerts
+    player_news_id = Column(Integer, ForeignKey("player_news.id"), nullable=True)  # Set for news
+    week_number = Column(Integer, nullable=True)  # Set for roster alerts
+    alert_kind = Column(String, nullable=True)  # Set for roster alerts, e.g. "inactive_starter:out"
+    
+    # Denormalized content so the feed can be read without joins
+    title = Column(String, nullable=False)
+    content = Column(Text, nullable=True)
+    published_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    
+    # Relationships
+    user = relationship("User", back_populates="feed_items")
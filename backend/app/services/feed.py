@@ -0,0 +1,286 @@
+"""
+Roster-aware personalized feed for FFLIQ backend.
+
+News and roster alerts are fanned out to per-user `FeedItem` rows when they are
+written, using a player -> teams reverse index built from `Roster`. Reading a
+feed is then a single range read on (user_id, id) instead of a join across
+users, teams, rosters and news. `trim_feeds` caps each feed at `FEED_MAX_ITEMS`
+items and should run periodically:
+    python -m app.services.feed trim
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple
+import argparse
+import logging
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.database import get_db_context
+from app.models.db_models import (
+    FeedItem, FeedItemTypeEnum, NFLPlayer, PlayerNews, Roster, Team
+)
+
+logger = logging.getLogger(__name__)
+
+# Player statuses that don't trigger an inactive starter alert
+ACTIVE_PLAYER_STATUSES = {None, "active"}
+
+# Alert kind prefix of inactive starter alerts; the player status is appended
+INACTIVE_STARTER_ALERT = "inactive_starter"
+
+# Maximum number of feed items inserted per statement when fanning out
+FEED_INSERT_BATCH_SIZE = 1000
+
+
+class PlayerTeamIndex:
+    """
+    Reverse index from NFL player to the fantasy teams rostering them for a week.
+
+    Rebuild it after roster syncs; lookups then don't touch the database.
+    Usage:
+        index = PlayerTeamIndex.build(db, week_number=3)
+        publish_news(db, news, index)
+    """
+
+    def __init__(self, week_number: int):
+        self.week_number = week_number
+        # nfl_player_id -> {(team_id, user_id)}
+        self._teams: Dict[int, Set[Tuple[int, int]]] = {}
+
+    @classmethod
+    def build(cls, db: Session, week_number: int) -> "PlayerTeamIndex":
+        """Build the index from the rosters of a week."""
+        index = cls(week_number)
+        rows = (
+            db.query(Roster.nfl_player_id, Team.id, Team.user_id)
+            .join(Team, Roster.team_id == Team.id)
+            .filter(Roster.week_number == week_number, Team.user_id.isnot(None))
+            .all()
+        )
+        for nfl_player_id, team_id, user_id in rows:
+            index.add(nfl_player_id, team_id, user_id)
+        logger.info("Built player-team index for week %d with %d players", week_number, len(index._teams))
+        return index
+
+    def add(self, nfl_player_id: int, team_id: int, user_id: int) -> None:
+        """Record that a team rosters a player."""
+        self._teams.setdefault(nfl_player_id, set()).add((team_id, user_id))
+
+    def remove(self, nfl_player_id: int, team_id: int, user_id: int) -> None:
+        """Forget that a team rosters a player."""
+        teams = self._teams.get(nfl_player_id)
+        if teams:
+            teams.discard((team_id, user_id))
+            if not teams:
+                del self._teams[nfl_player_id]
+
+    def teams_for(self, nfl_player_id: int) -> Set[Tuple[int, int]]:
+        """Return the (team_id, user_id) pairs rostering a player."""
+        return self._teams.get(nfl_player_id, set())
+
+    def users_for(self, nfl_player_id: int) -> Set[int]:
+        """Return the IDs of users with the player on any of their teams."""
+        return {user_id for _, user_id in self.teams_for(nfl_player_id)}
+
+
+def _fan_out(db: Session, rows: List[Dict[str, Any]]) -> List[FeedItem]:
+    """
+    Insert feed items in batches, skipping ones that already exist.
+
+    Returns the newly inserted items.
+    """
+    items: List[FeedItem] = []
+    for start in range(0, len(rows), FEED_INSERT_BATCH_SIZE):
+        batch = rows[start:start + FEED_INSERT_BATCH_SIZE]
+        items.extend(db.scalars(
+            insert(FeedItem).values(batch).on_conflict_do_nothing().returning(FeedItem)
+        ).all())
+    return items
+
+
+def trim_feeds(db: Session, max_items: Optional[int] = None) -> int:
+    """
+    Delete all but the newest `max_items` feed items of each user over the cap.
+
+    Meant to run periodically rather than on every publish.
+    Returns the number of deleted rows.
+    """
+    max_items = max_items or settings.FEED_MAX_ITEMS
+    user_ids = db.execute(
+        text("SELECT user_id FROM feed_items GROUP BY user_id HAVING count(*) > :max_items"),
+        {"max_items": max_items},
+    ).scalars().all()
+    deleted = 0
+    for user_id in user_ids:
+        # Range delete below the oldest item to keep, on the (user_id, id) index
+        deleted += db.execute(
+            text(
+                """
+                DELETE FROM feed_items
+                WHERE user_id = :user_id AND id < (
+                    SELECT id FROM feed_items WHERE user_id = :user_id
+                    ORDER BY id DESC OFFSET :offset LIMIT 1
+                )
+                """
+            ),
+            {"user_id": user_id, "offset": max_items - 1},
+        ).rowcount
+    db.commit()
+    logger.info("Trimmed %d feed items of %d users", deleted, len(user_ids))
+    return deleted
+
+
+def _find_news(db: Session, news: PlayerNews) -> Optional[PlayerNews]:
+    """
+    Return an already stored copy of a news item, matched on source URL or,
+    without one, on source and title.
+    """
+    query = db.query(PlayerNews).filter(PlayerNews.nfl_player_id == news.nfl_player_id)
+    if news.source_url:
+        query = query.filter(PlayerNews.source_url == news.source_url)
+    else:
+        query = query.filter(PlayerNews.source == news.source, PlayerNews.title == news.title)
+    return query.order_by(PlayerNews.id).first()
+
+
+def publish_news(db: Session, news: PlayerNews, index: PlayerTeamIndex) -> List[FeedItem]:
+    """
+    Store a news item and fan it out to the feeds of users rostering the player.
+
+    Users with the player on several teams get a single feed item. A story that
+    is already stored (same source URL, or same source and title) isn't stored
+    again, and users who already got it don't get it twice.
+    """
+    if news.id is None:
+        news = _find_news(db, news) or news
+    db.add(news)
+    db.flush()
+    items = _fan_out(db, [
+        {
+            "user_id": user_id,
+            "item_type": FeedItemTypeEnum.NEWS.value,
+            "nfl_player_id": news.nfl_player_id,
+            "player_news_id": news.id,
+            "title": news.title,
+            "content": news.content,
+            "published_at": news.published_at,
+        }
+        for user_id in index.users_for(news.nfl_player_id)
+    ])
+    db.commit()
+    logger.info("Fanned out news %d to %d feeds", news.id, len(items))
+    return items
+
+
+def _roster_alert(
+    team_id: int,
+    user_id: int,
+    nfl_player_id: int,
+    week_number: int,
+    alert_kind: str,
+    title: str,
+    content: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the feed item values of a roster alert."""
+    return {
+        "user_id": user_id,
+        "item_type": FeedItemTypeEnum.ROSTER_ALERT.value,
+        "nfl_player_id": nfl_player_id,
+        "team_id": team_id,
+        "week_number": week_number,
+        "alert_kind": alert_kind,
+        "title": title,
+        "content": content,
+        "published_at": func.now(),
+    }
+
+
+def publish_roster_alert(
+    db: Session,
+    team_id: int,
+    user_id: int,
+    nfl_player_id: int,
+    week_number: int,
+    alert_kind: str,
+    title: str,
+    content: Optional[str] = None,
+) -> Optional[FeedItem]:
+    """
+    Write a roster alert to the feed of a team's owner.
+
+    Returns None if an alert of the same kind was already published for that
+    team, player and week.
+    """
+    items = _fan_out(db, [
+        _roster_alert(team_id, user_id, nfl_player_id, week_number, alert_kind, title, content)
+    ])
+    db.commit()
+    return items[0] if items else None
+
+
+def alert_inactive_starters(db: Session, week_number: int) -> List[FeedItem]:
+    """
+    Alert team owners about starters whose player status is not active
+    (e.g. injured) for a week.
+
+    Safe to run repeatedly: each starter is alerted once per team, week and
+    status, so a change such as questionable -> out is alerted again.
+    """
+    rows = (
+        db.query(Roster.team_id, Team.user_id, NFLPlayer.id, NFLPlayer.name, NFLPlayer.status)
+        .join(Team, Roster.team_id == Team.id)
+        .join(NFLPlayer, Roster.nfl_player_id == NFLPlayer.id)
+        .filter(
+            Roster.week_number == week_number,
+            Roster.is_starter.is_(True),
+            Team.user_id.isnot(None),
+        )
+        .all()
+    )
+    items = _fan_out(db, [
+        _roster_alert(
+            team_id,
+            user_id,
+            nfl_player_id,
+            week_number,
+            alert_kind=f"{INACTIVE_STARTER_ALERT}:{status}",
+            title=f"{name} is {status} but in your week {week_number} lineup",
+        )
+        for team_id, user_id, nfl_player_id, name, status in rows
+        if status not in ACTIVE_PLAYER_STATUSES
+    ])
+    db.commit()
+    logger.info("Published %d inactive starter alerts for week %d", len(items), week_number)
+    return items
+
+
+def get_feed(
+    db: Session, user_id: int, before_id: Optional[int] = None, limit: int = 50
+) -> List[FeedItem]:
+    """
+    Return a page of a user's feed, newest first.
+
+    Pass the ID of the last item of the previous page as `before_id` to get the next page.
+    """
+    query = db.query(FeedItem).filter(FeedItem.user_id == user_id)
+    if before_id is not None:
+        query = query.filter(FeedItem.id < before_id)
+    return query.order_by(FeedItem.id.desc()).limit(limit).all()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Feed maintenance")
+    parser.add_argument("command", choices=["trim"])
+    parser.add_argument("--max-items", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with get_db_context() as db:
+        trim_feeds(db, args.max_items)
+
+
+if __name__ == "__main__":
+    main()
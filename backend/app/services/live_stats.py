@@ -0,0 +1,312 @@
+"""
+Live game-day stat delta processing for FFLIQ backend.
+
+During games only players whose NFL team is playing in an active `GameSchedule`
+row have changing stats. The `LiveStatsTracker` keeps the last known `PlayerStats`
+values for those players in memory, diffs incoming box scores against that
+snapshot and only writes and forwards the players whose stats actually changed.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+import logging
+import time
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.db_models import GameSchedule, NFLPlayer, PlayerStats, StatusEnum
+from app.models.schemas import PlayerStatsCreate
+
+logger = logging.getLogger(__name__)
+
+# Normalized stat fields compared between box scores and the in-memory snapshot
+LIVE_STAT_FIELDS: Tuple[str, ...] = (
+    "passing_yards", "passing_tds", "interceptions", "passing_completions", "passing_attempts",
+    "rushing_yards", "rushing_tds", "rushing_attempts",
+    "receiving_yards", "receiving_tds", "receptions", "targets",
+    "fumbles_lost",
+)
+
+
+@dataclass
+class StatDelta:
+    """Changed stat fields for one player, as (old, new) pairs keyed by field name."""
+    nfl_player_id: int
+    week_number: int
+    season_year: int
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+
+
+# Callback invoked with the changed players after each poll (e.g. scoring, caching)
+DeltaHandler = Callable[[List[StatDelta]], None]
+
+# Callable that fetches box scores for the given in-progress games from a provider
+BoxScoreFetcher = Callable[[List[GameSchedule]], Iterable[PlayerStatsCreate]]
+
+
+def get_active_games(db: Session, season_year: int, week_number: int) -> List[GameSchedule]:
+    """Return the games of a week that are currently in progress."""
+    return (
+        db.query(GameSchedule)
+        .filter(
+            GameSchedule.season_year == season_year,
+            GameSchedule.week_number == week_number,
+            GameSchedule.status == StatusEnum.ACTIVE,
+        )
+        .all()
+    )
+
+
+def has_pending_games(db: Session, season_year: int, week_number: int) -> bool:
+    """Return True if any game of the week is still scheduled or in progress."""
+    return db.query(
+        db.query(GameSchedule)
+        .filter(
+            GameSchedule.season_year == season_year,
+            GameSchedule.week_number == week_number,
+            GameSchedule.status.in_([StatusEnum.SCHEDULED, StatusEnum.ACTIVE]),
+        )
+        .exists()
+    ).scalar()
+
+
+def get_active_teams(games: Iterable[GameSchedule]) -> Set[str]:
+    """Return the NFL team codes playing in the given games."""
+    teams: Set[str] = set()
+    for game in games:
+        teams.add(game.nfl_team_home)
+        teams.add(game.nfl_team_away)
+    return teams
+
+
+class LiveStatsTracker:
+    """
+    In-memory snapshot of live `PlayerStats` for one season week.
+
+    Usage:
+        tracker = LiveStatsTracker(season_year=2025, week_number=3)
+        tracker.add_handler(recalculate_points)
+        with get_db_context() as db:
+            tracker.poll(db, fetch_box_scores)
+    """
+
+    def __init__(self, season_year: int, week_number: int):
+        self.season_year = season_year
+        self.week_number = week_number
+        self._handlers: List[DeltaHandler] = []
+        self._active_game_ids: Set[int] = set()
+        self._active_player_ids: Set[int] = set()
+        self._finished_game_ids: Set[int] = set()
+        # nfl_player_id -> (player_stats.id or None, {field: value})
+        self._snapshot: Dict[int, Tuple[Optional[int], Dict[str, Any]]] = {}
+
+    def add_handler(self, handler: DeltaHandler) -> None:
+        """Register a callback that receives the changed players after each poll."""
+        self._handlers.append(handler)
+
+    @property
+    def tracked_player_ids(self) -> Set[int]:
+        """IDs of the players currently held in the snapshot."""
+        return set(self._snapshot)
+
+    def refresh_games(self, db: Session) -> List[GameSchedule]:
+        """
+        Sync the tracked players with the currently active games.
+
+        Returns the games to fetch box scores for: the active games plus games that
+        stopped being active since the last refresh, so final stat corrections are
+        still picked up once. Players of games that became active are loaded from
+        `PlayerStats` once; players of games that are no longer active are dropped
+        from the snapshot after that final fetch (see `poll`).
+        """
+        games = get_active_games(db, self.season_year, self.week_number)
+        game_ids = {game.id for game in games}
+
+        # Kept until a poll succeeded, so a failed final fetch is retried
+        self._finished_game_ids |= self._active_game_ids - game_ids
+        finished_games = []
+        if self._finished_game_ids:
+            finished_games = (
+                db.query(GameSchedule).filter(GameSchedule.id.in_(self._finished_game_ids)).all()
+            )
+        if game_ids == self._active_game_ids:
+            return games + finished_games
+
+        teams = get_active_teams(games)
+        player_ids = set()
+        if teams:
+            player_ids = {
+                player_id
+                for (player_id,) in db.query(NFLPlayer.id)
+                .filter(
+                    NFLPlayer.nfl_team.in_(teams),
+                    NFLPlayer.season_year == self.season_year,
+                    NFLPlayer.active_flag.is_(True),
+                )
+                .all()
+            }
+
+        new_ids = player_ids - self.tracked_player_ids
+        if new_ids:
+            rows = (
+                db.query(PlayerStats)
+                .filter(
+                    PlayerStats.nfl_player_id.in_(new_ids),
+                    PlayerStats.season_year == self.season_year,
+                    PlayerStats.week_number == self.week_number,
+                )
+                .all()
+            )
+            for row in rows:
+                self._snapshot[row.nfl_player_id] = (
+                    row.id,
+                    {name: getattr(row, name) for name in LIVE_STAT_FIELDS},
+                )
+            # Players without a stats row yet start from the column defaults (zero)
+            for player_id in new_ids - {row.nfl_player_id for row in rows}:
+                self._snapshot[player_id] = (
+                    None,
+                    {name: PlayerStats.__table__.c[name].default.arg for name in LIVE_STAT_FIELDS},
+                )
+
+        self._active_game_ids = game_ids
+        self._active_player_ids = player_ids
+        logger.info(
+            "Tracking %d players across %d active games (%d just finished)",
+            len(self._snapshot), len(games), len(finished_games),
+        )
+        return games + finished_games
+
+    def drop_inactive_players(self) -> None:
+        """Drop players whose games are no longer active from the snapshot."""
+        for player_id in self.tracked_player_ids - self._active_player_ids:
+            del self._snapshot[player_id]
+
+    def diff(self, box_scores: Iterable[PlayerStatsCreate]) -> List[StatDelta]:
+        """
+        Compare box scores with the snapshot and return only the changed players.
+
+        Box scores for players outside the active games or for another week are ignored.
+        """
+        deltas: List[StatDelta] = []
+        for stats in box_scores:
+            if (
+                stats.nfl_player_id not in self._snapshot
+                or stats.season_year != self.season_year
+                or stats.week_number != self.week_number
+            ):
+                continue
+            _, previous = self._snapshot[stats.nfl_player_id]
+            changes = {}
+            for name in LIVE_STAT_FIELDS:
+                old, new = previous.get(name), getattr(stats, name)
+                if old != new:
+                    changes[name] = (old, new)
+            if changes:
+                deltas.append(
+                    StatDelta(
+                        nfl_player_id=stats.nfl_player_id,
+                        week_number=self.week_number,
+                        season_year=self.season_year,
+                        changes=changes,
+                    )
+                )
+        return deltas
+
+    def apply(self, db: Session, deltas: List[StatDelta]) -> None:
+        """Write the changed players to `PlayerStats` and update the snapshot."""
+        if not deltas:
+            return
+        row_ids = [self._snapshot[d.nfl_player_id][0] for d in deltas]
+        rows = {
+            row.id: row
+            for row in db.query(PlayerStats)
+            .filter(
+                PlayerStats.season_year == self.season_year,
+                PlayerStats.id.in_([i for i in row_ids if i is not None]),
+            )
+            .all()
+        }
+
+        new_rows = []
+        snapshot_updates = {}
+        try:
+            for delta, row_id in zip(deltas, row_ids):
+                row = rows.get(row_id)
+                if row is None:
+                    row = PlayerStats(
+                        nfl_player_id=delta.nfl_player_id,
+                        week_number=delta.week_number,
+                        season_year=delta.season_year,
+                    )
+                    db.add(row)
+                    new_rows.append((delta.nfl_player_id, row))
+                for name, (_, new) in delta.changes.items():
+                    setattr(row, name, new)
+                snapshot_updates[delta.nfl_player_id] = {
+                    name: new for name, (_, new) in delta.changes.items()
+                }
+            db.commit()
+        except Exception:
+            # Keep the snapshot as is so the next poll diffs and writes these changes again
+            db.rollback()
+            raise
+
+        for player_id, values in snapshot_updates.items():
+            self._snapshot[player_id][1].update(values)
+        # Remember IDs of inserted rows so later polls update instead of insert
+        for player_id, row in new_rows:
+            self._snapshot[player_id] = (row.id, self._snapshot[player_id][1])
+
+    def poll(self, db: Session, fetch: BoxScoreFetcher) -> List[StatDelta]:
+        """
+        Run one live update cycle.
+
+        Fetches box scores only for in-progress games (and once more for games that
+        just finished), persists the changed players and forwards them to the
+        registered handlers.
+        """
+        games = self.refresh_games(db)
+        if not games:
+            return []
+        deltas = self.diff(fetch(games))
+        self.apply(db, deltas)
+        self._finished_game_ids.clear()
+        self.drop_inactive_players()
+        # The changes are persisted already: a failing handler must not stop the others
+        if deltas:
+            for handler in self._handlers:
+                try:
+                    handler(deltas)
+                except Exception:
+                    logger.exception("Live stats handler %r failed", handler)
+        logger.info("Live poll: %d changed players", len(deltas))
+        return deltas
+
+    def run(
+        self,
+        session_factory: Callable[[], Any],
+        fetch: BoxScoreFetcher,
+        interval: Optional[int] = None,
+    ) -> None:
+        """
+        Poll until the week has no scheduled or active games left.
+
+        Can be started before kickoff. A failed poll (provider timeout, database
+        error) is logged and retried on the next interval.
+        `session_factory` is a context manager factory such as `get_db_context`.
+        """
+        interval = interval or settings.LIVE_STATS_POLL_INTERVAL
+        while True:
+            try:
+                with session_factory() as db:
+                    self.poll(db, fetch)
+                    done = not self._finished_game_ids and not has_pending_games(
+                        db, self.season_year, self.week_number
+                    )
+            except Exception:
+                logger.exception("Live poll failed, retrying in %d seconds", interval)
+                done = False
+            if done:
+                break
+            time.sleep(interval)
@@ -2,6 +2,8 @@
 # Usage: ./scripts/db.sh migrate "Description"
 # Usage: ./scripts/db.sh upgrade
 # Usage: ./scripts/db.sh downgrade
+# Usage: ./scripts/db.sh partitions {create|compact|archive|restore} <season_year>
+# Usage: ./scripts/db.sh feed-trim
 
 case "$1" in
   migrate)
@@ -13,8 +15,14 @@ case "$1" in
   downgrade)
     docker-compose exec backend alembic downgrade -1
     ;;
+  partitions)
+    docker-compose exec backend python -m app.db.partitions "$2" "$3"
+    ;;
+  feed-trim)
+    docker-compose exec backend python -m app.services.feed trim
+    ;;
   *)
-    echo "Usage: $0 {migrate|upgrade|downgrade}"
+    echo "Usage: $0 {migrate|upgrade|downgrade|partitions|feed-trim}"
     exit 1
     ;;
 esac
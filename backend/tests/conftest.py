@@ -0,0 +1,72 @@
+"""
+Shared pytest fixtures for FFLIQ backend tests.
+
+Tests run against PostgreSQL (partitioning is Postgres-specific). The schema is
+built with the Alembic migrations. Set TEST_DATABASE_URL to point at a
+throwaway database; tests are skipped if it can't be reached.
+"""
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+TEST_DATABASE_URL = os.environ.get(
+    "TEST_DATABASE_URL", "postgresql://ffliq_user:ffliq_pass@db:5432/ffliq_test"
+)
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.models.db_models import Base  # noqa: E402
+
+
+def alembic_config(connection) -> Config:
+    """Alembic config running migrations on the given connection."""
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.attributes["connection"] = connection
+    return config
+
+
+def migrate(engine, action, revision) -> None:
+    """Run an Alembic command such as `command.upgrade` on the test database."""
+    with engine.begin() as connection:
+        action(alembic_config(connection), revision)
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Engine for a freshly migrated test database."""
+    engine = create_engine(TEST_DATABASE_URL)
+    try:
+        engine.connect().close()
+    except OperationalError:
+        pytest.skip(f"Test database not reachable at {TEST_DATABASE_URL}")
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA IF EXISTS archive CASCADE"))
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+    migrate(engine, command.upgrade, "head")
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Session on the test database; all tables are emptied after each test."""
+    session = Session(engine)
+    yield session
+    session.rollback()
+    session.close()
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
@@ -0,0 +1,132 @@
+"""
+Tests for the roster-aware personalized feed.
+"""
+from datetime import datetime
+
+import pytest
+
+from app.models.db_models import FeedItem, NFLPlayer, PlayerNews, Roster, Team, User
+from app.services.feed import (
+    PlayerTeamIndex, alert_inactive_starters, get_feed, publish_news, publish_roster_alert,
+    trim_feeds,
+)
+
+WEEK = 3
+
+
+@pytest.fixture
+def feed_db(db):
+    """
+    User 1 has player 1 on two teams and starts injured player 2 on one of them;
+    user 2 starts player 1 and benches injured player 2.
+    """
+    db.add_all([
+        User(id=1, username="one", email="one@example.com", hashed_password="x"),
+        User(id=2, username="two", email="two@example.com", hashed_password="x"),
+        NFLPlayer(id=1, name="Healthy Player", position="RB", nfl_team="KC",
+                  global_player_id="p1", season_year=2025, status="active"),
+        NFLPlayer(id=2, name="Hurt Player", position="WR", nfl_team="KC",
+                  global_player_id="p2", season_year=2025, status="injured"),
+    ])
+    db.flush()
+    db.add_all([
+        Team(id=10, name="A", user_id=1),
+        Team(id=11, name="B", user_id=1),
+        Team(id=20, name="C", user_id=2),
+    ])
+    db.flush()
+    for team_id, player_id, starter in [
+        (10, 1, True), (10, 2, True), (11, 1, False), (20, 1, True), (20, 2, False),
+    ]:
+        db.add(Roster(team_id=team_id, nfl_player_id=player_id, roster_position="FLEX",
+                      week_number=WEEK, is_starter=starter))
+    db.commit()
+    return db
+
+
+def test_publish_news_fans_out_once_per_user(feed_db, monkeypatch):
+    # One recipient per insert statement
+    monkeypatch.setattr("app.services.feed.FEED_INSERT_BATCH_SIZE", 1)
+    index = PlayerTeamIndex.build(feed_db, WEEK)
+    assert index.users_for(1) == {1, 2}
+
+    news = PlayerNews(nfl_player_id=1, title="Limited in practice", content="...",
+                      source="team", source_url="https://example.com/1",
+                      published_at=datetime(2025, 9, 18))
+    items = publish_news(feed_db, news, index)
+
+    assert sorted(item.user_id for item in items) == [1, 2]
+    # Reprocessing the same news doesn't duplicate it
+    assert publish_news(feed_db, news, index) == []
+    assert feed_db.query(FeedItem).count() == 2
+
+
+def test_reingested_news_is_not_duplicated(feed_db):
+    index = PlayerTeamIndex.build(feed_db, WEEK)
+
+    def story(**fields):
+        return PlayerNews(nfl_player_id=1, content="...", published_at=datetime(2025, 9, 18), **fields)
+
+    publish_news(feed_db, story(title="Out for the season", source_url="https://example.com/2"), index)
+    assert publish_news(
+        feed_db, story(title="Out for the season (updated)", source_url="https://example.com/2"), index
+    ) == []
+    publish_news(feed_db, story(title="Questionable", source="beat writer"), index)
+    assert publish_news(feed_db, story(title="Questionable", source="beat writer"), index) == []
+
+    assert feed_db.query(PlayerNews).count() == 2
+    assert feed_db.query(FeedItem).count() == 4
+
+
+def test_alert_inactive_starters_is_idempotent(feed_db):
+    items = alert_inactive_starters(feed_db, WEEK)
+
+    assert [(item.user_id, item.team_id, item.nfl_player_id, item.week_number) for item in items] == [
+        (1, 10, 2, WEEK)
+    ]
+    assert items[0].title == "Hurt Player is injured but in your week 3 lineup"
+    assert alert_inactive_starters(feed_db, WEEK) == []
+    assert feed_db.query(FeedItem).count() == 1
+
+
+def test_status_change_publishes_new_alert(feed_db):
+    alert_inactive_starters(feed_db, WEEK)
+    feed_db.query(NFLPlayer).filter(NFLPlayer.id == 2).update({"status": "out"})
+    feed_db.commit()
+
+    items = alert_inactive_starters(feed_db, WEEK)
+
+    assert [(item.alert_kind, item.title) for item in items] == [
+        ("inactive_starter:out", "Hurt Player is out but in your week 3 lineup")
+    ]
+    assert [item.alert_kind for item in get_feed(feed_db, 1)] == [
+        "inactive_starter:out", "inactive_starter:injured"
+    ]
+
+
+def publish_alerts(db, weeks):
+    return [
+        publish_roster_alert(db, 10, 1, 2, week_number=week, alert_kind="test", title=f"Week {week}").id
+        for week in weeks
+    ]
+
+
+def test_get_feed_pages_newest_first(feed_db):
+    ids = publish_alerts(feed_db, range(1, 6))
+
+    first = get_feed(feed_db, 1, limit=2)
+    second = get_feed(feed_db, 1, before_id=first[-1].id, limit=2)
+    last = get_feed(feed_db, 1, before_id=second[-1].id, limit=2)
+
+    assert [item.id for item in first + second + last] == ids[::-1]
+    assert get_feed(feed_db, 2) == []
+
+
+def test_trim_feeds_keeps_newest_items_of_users_over_cap(feed_db):
+    ids = publish_alerts(feed_db, range(1, 6))
+    other = publish_roster_alert(feed_db, 20, 2, 1, week_number=1, alert_kind="test", title="Other")
+
+    assert trim_feeds(feed_db, max_items=3) == 2
+
+    assert [item.id for item in get_feed(feed_db, 1)] == ids[:1:-1]
+    assert [item.id for item in get_feed(feed_db, 2)] == [other.id]
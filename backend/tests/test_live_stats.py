@@ -0,0 +1,178 @@
+"""
+Tests for live game-day stat delta processing.
+"""
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+from app.models.db_models import GameSchedule, NFLPlayer, PlayerStats, StatusEnum
+from app.models.schemas import PlayerStatsCreate
+from app.services.live_stats import LiveStatsTracker
+
+SEASON, WEEK = 2025, 3
+
+
+@pytest.fixture
+def live_db(db):
+    """Active KC-DEN game, scheduled BUF-MIA game and a mix of players."""
+    db.add_all([
+        GameSchedule(id=1, nfl_team_home="KC", nfl_team_away="DEN", week_number=WEEK,
+                     season_year=SEASON, game_time=datetime(2025, 9, 21), status=StatusEnum.ACTIVE),
+        GameSchedule(id=2, nfl_team_home="BUF", nfl_team_away="MIA", week_number=WEEK,
+                     season_year=SEASON, game_time=datetime(2025, 9, 21), status=StatusEnum.SCHEDULED),
+    ])
+    for player_id, team, season_year, active in [
+        (1, "KC", SEASON, True),
+        (2, "DEN", SEASON, True),
+        (3, "BUF", SEASON, True),
+        (4, "KC", SEASON - 1, True),
+        (5, "KC", SEASON, False),
+    ]:
+        db.add(NFLPlayer(
+            id=player_id, name=f"Player {player_id}", position="QB", nfl_team=team,
+            global_player_id=f"p{player_id}", season_year=season_year, active_flag=active,
+        ))
+    db.flush()
+    db.add(PlayerStats(nfl_player_id=1, week_number=WEEK, season_year=SEASON, passing_yards=100.0))
+    db.commit()
+    return db
+
+
+def box_score(player_id, **stats):
+    return PlayerStatsCreate(nfl_player_id=player_id, week_number=WEEK, season_year=SEASON, **stats)
+
+
+def test_refresh_tracks_only_current_active_players_of_active_games(live_db):
+    tracker = LiveStatsTracker(SEASON, WEEK)
+    games = tracker.refresh_games(live_db)
+
+    assert [game.id for game in games] == [1]
+    assert tracker.tracked_player_ids == {1, 2}
+
+
+def test_unchanged_box_score_produces_no_delta(live_db):
+    tracker = LiveStatsTracker(SEASON, WEEK)
+    tracker.refresh_games(live_db)
+
+    assert tracker.diff([box_score(1, passing_yards=100.0), box_score(2)]) == []
+
+    deltas = tracker.diff([box_score(1, passing_yards=112.0, passing_tds=1)])
+    assert len(deltas) == 1
+    assert deltas[0].changes == {"passing_yards": (100.0, 112.0), "passing_tds": (0, 1)}
+
+
+def test_players_of_inactive_games_are_ignored(live_db):
+    tracker = LiveStatsTracker(SEASON, WEEK)
+    tracker.refresh_games(live_db)
+
+    assert tracker.diff([box_score(3, rushing_yards=20.0), box_score(5, rushing_yards=5.0)]) == []
+
+
+def test_insert_then_update_reuses_row(live_db):
+    tracker = LiveStatsTracker(SEASON, WEEK)
+    forwarded = []
+    tracker.add_handler(forwarded.append)
+
+    tracker.poll(live_db, lambda games: [box_score(2, rushing_yards=10.0)])
+    row_id = live_db.query(PlayerStats).filter(PlayerStats.nfl_player_id == 2).one().id
+    tracker.poll(live_db, lambda games: [box_score(2, rushing_yards=25.0)])
+    # Nothing changed, nothing forwarded
+    tracker.poll(live_db, lambda games: [box_score(2, rushing_yards=25.0)])
+
+    rows = live_db.query(PlayerStats).filter(PlayerStats.nfl_player_id == 2).all()
+    assert [(row.id, row.rushing_yards) for row in rows] == [(row_id, 25.0)]
+    assert [[d.changes for d in deltas] for deltas in forwarded] == [
+        [{"rushing_yards": (0.0, 10.0)}],
+        [{"rushing_yards": (10.0, 25.0)}],
+    ]
+
+
+def test_finished_game_is_fetched_once_more(live_db):
+    tracker = LiveStatsTracker(SEASON, WEEK)
+    tracker.poll(live_db, lambda games: [box_score(1, passing_yards=250.0)])
+
+    live_db.query(GameSchedule).filter(GameSchedule.id == 1).update({"status": StatusEnum.COMPLETED})
+    live_db.commit()
+    fetched = []
+
+    def fetch(games):
+        fetched.append([game.id for game in games])
+        return [box_score(1, passing_yards=255.0)]
+
+    deltas = tracker.poll(live_db, fetch)
+
+    assert fetched == [[1]]
+    assert [d.changes for d in deltas] == [{"passing_yards": (250.0, 255.0)}]
+    assert tracker.tracked_player_ids == set()
+    assert tracker.poll(live_db, fetch) == []
+    assert fetched == [[1]]
+
+
+def test_failed_commit_keeps_snapshot(live_db, monkeypatch):
+    tracker = LiveStatsTracker(SEASON, WEEK)
+    tracker.refresh_games(live_db)
+    deltas = tracker.diff([box_score(1, passing_yards=130.0)])
+
+    def fail():
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(live_db, "commit", fail)
+    with pytest.raises(RuntimeError):
+        tracker.apply(live_db, deltas)
+    monkeypatch.undo()
+
+    assert tracker.diff([box_score(1, passing_yards=130.0)]) == deltas
+
+
+def test_failing_handler_does_not_stop_others(live_db, caplog):
+    tracker = LiveStatsTracker(SEASON, WEEK)
+    forwarded = []
+
+    def broken(deltas):
+        raise RuntimeError("cache down")
+
+    tracker.add_handler(broken)
+    tracker.add_handler(forwarded.append)
+
+    deltas = tracker.poll(live_db, lambda games: [box_score(1, passing_yards=120.0)])
+
+    assert forwarded == [deltas]
+    assert "handler" in caplog.text
+
+
+def test_run_waits_for_kickoff_and_survives_failed_polls(live_db, monkeypatch):
+    # No game has kicked off yet
+    live_db.query(GameSchedule).update({"status": StatusEnum.SCHEDULED})
+    live_db.commit()
+    tracker = LiveStatsTracker(SEASON, WEEK)
+
+    def set_status(game_id, status):
+        live_db.query(GameSchedule).filter(GameSchedule.id == game_id).update({"status": status})
+        live_db.commit()
+
+    # Each sleep advances the game day by one step
+    steps = iter([
+        lambda: set_status(1, StatusEnum.ACTIVE),
+        lambda: None,  # the fetch below fails once
+        lambda: (set_status(1, StatusEnum.COMPLETED), set_status(2, StatusEnum.COMPLETED)),
+    ])
+    monkeypatch.setattr("app.services.live_stats.time.sleep", lambda seconds: next(steps)())
+    calls = []
+
+    def fetch(games):
+        calls.append([game.id for game in games])
+        if len(calls) == 1:
+            raise TimeoutError("provider timeout")
+        return [box_score(1, passing_yards=100.0 + len(calls))]
+
+    @contextmanager
+    def session_factory():
+        yield live_db
+
+    tracker.run(session_factory, fetch, interval=1)
+
+    # Failed poll, successful poll, final fetch after the game finished
+    assert calls == [[1], [1], [1]]
+    row = live_db.query(PlayerStats).filter(PlayerStats.nfl_player_id == 1).one()
+    assert row.passing_yards == 103.0
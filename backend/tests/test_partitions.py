@@ -0,0 +1,171 @@
+"""
+Tests for season partition management.
+"""
+from datetime import datetime
+
+import pytest
+from alembic import command
+from sqlalchemy import text, update
+
+from app.db.partitions import (
+    archive_season, compact_projections, create_season_partitions, restore_season
+)
+from app.models.db_models import NFLPlayer, PlayerProjection, PlayerStats
+from tests.conftest import alembic_config, migrate
+
+
+def add_player(db, player_id=1):
+    db.add(NFLPlayer(
+        id=player_id, name=f"Player {player_id}", position="QB", nfl_team="KC",
+        global_player_id=f"p{player_id}", season_year=2025,
+    ))
+    db.flush()
+
+
+def add_projection(db, source="espn", created_at=None, week_number=1, season_year=2025):
+    """Add a projection; without created_at the column default applies."""
+    projection = PlayerProjection(
+        nfl_player_id=1, week_number=week_number, season_year=season_year,
+        projection_source=source, created_at=created_at,
+    )
+    db.add(projection)
+    db.flush()
+    return projection
+
+
+def test_compact_projections_keeps_latest_per_player_week_source(db):
+    add_player(db)
+    add_projection(db, created_at=datetime(2025, 9, 1))
+    latest = add_projection(db, created_at=datetime(2025, 9, 3))
+    add_projection(db, created_at=datetime(2025, 9, 2))
+    # created_at is nullable (client-side default only); NULL must not count as latest
+    undated = add_projection(db)
+    db.execute(
+        update(PlayerProjection)
+        .where(PlayerProjection.id == undated.id)
+        .values(created_at=None)
+    )
+    other_source = add_projection(db, source="ai", created_at=datetime(2025, 9, 1))
+    other_week = add_projection(db, week_number=2, created_at=datetime(2025, 9, 1))
+    # Other seasons are left untouched
+    add_projection(db, season_year=2024, created_at=datetime(2024, 9, 1))
+    add_projection(db, season_year=2024, created_at=datetime(2024, 9, 2))
+    db.commit()
+
+    assert compact_projections(db, 2025) == 3
+
+    remaining = {
+        p.id for p in db.query(PlayerProjection).filter(PlayerProjection.season_year == 2025)
+    }
+    assert remaining == {latest.id, other_source.id, other_week.id}
+    assert db.query(PlayerProjection).filter(PlayerProjection.season_year == 2024).count() == 2
+
+
+def test_create_season_partitions_moves_rows_out_of_default(db):
+    add_player(db)
+    projection = add_projection(db, season_year=2031)
+    db.commit()
+
+    create_season_partitions(db, 2031)
+    # Running again is a no-op
+    create_season_partitions(db, 2031)
+
+    partition_ids = db.execute(text("SELECT id FROM player_projections_2031")).scalars().all()
+    default_ids = db.execute(
+        text("SELECT id FROM player_projections_default WHERE season_year = 2031")
+    ).scalars().all()
+    assert partition_ids == [projection.id]
+    assert default_ids == []
+    assert db.query(PlayerProjection).filter(PlayerProjection.season_year == 2031).count() == 1
+
+
+def test_autogenerate_ignores_season_partitions(db):
+    create_season_partitions(db, 2030)
+    db.close()
+
+    # Raises if the models and the migrated database differ
+    with db.get_bind().connect() as connection:
+        command.check(alembic_config(connection))
+
+
+def test_partition_migration_keeps_existing_rows(db, engine):
+    migrate(engine, command.downgrade, "5c0e1f2a9b3d")
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO nfl_players (id, name, position, nfl_team, global_player_id, active_flag, season_year) "
+                "VALUES (1, 'Player', 'QB', 'KC', 'p1', true, 2025)"
+            ))
+            connection.execute(text(
+                "INSERT INTO leagues (id, name, season_year, status, created_at, updated_at) "
+                "VALUES (1, 'League', 2025, 'active', now(), now())"
+            ))
+            for season_year in (2024, 2024, 2025):
+                connection.execute(text(
+                    "INSERT INTO player_stats (nfl_player_id, week_number, season_year) "
+                    "VALUES (1, 1, :season_year)"
+                ), {"season_year": season_year})
+            connection.execute(text(
+                "INSERT INTO player_projections (nfl_player_id, week_number, season_year, projection_source) "
+                "VALUES (1, 1, 2025, 'espn')"
+            ))
+            connection.execute(text(
+                "INSERT INTO player_points (nfl_player_id, league_id, week_number, season_year, points) "
+                "VALUES (1, 1, 1, 2024, 12.5)"
+            ))
+
+        migrate(engine, command.upgrade, "head")
+
+        with engine.connect() as connection:
+            def count(table):
+                return connection.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+            assert count("player_stats_2024") == 2
+            assert count("player_stats_2025") == 1
+            assert count("player_stats_default") == 0
+            assert count("player_projections_2025") == 1
+            assert count("player_points_2024") == 1
+        # IDs are preserved and the sequence continues after them
+        stats = PlayerStats(nfl_player_id=1, week_number=2, season_year=2025)
+        db.add(stats)
+        db.commit()
+        assert stats.id == 4
+        db.close()
+
+        migrate(engine, command.downgrade, "5c0e1f2a9b3d")
+        with engine.connect() as connection:
+            assert connection.execute(text(
+                "SELECT relkind FROM pg_class WHERE relname = 'player_stats'"
+            )).scalar() == "r"
+            assert connection.execute(text(
+                "SELECT array_agg(id ORDER BY id) FROM player_stats"
+            )).scalar() == [1, 2, 3, 4]
+    finally:
+        migrate(engine, command.upgrade, "head")
+
+
+def test_archive_and_restore_season(db):
+    add_player(db)
+    db.add(PlayerStats(nfl_player_id=1, week_number=1, season_year=2022))
+    db.commit()
+    create_season_partitions(db, 2022)
+
+    archive_season(db, 2022)
+    assert db.query(PlayerStats).filter(PlayerStats.season_year == 2022).count() == 0
+    assert db.execute(text("SELECT count(*) FROM archive.player_stats_2022")).scalar() == 1
+    with pytest.raises(ValueError):
+        create_season_partitions(db, 2022)
+    db.rollback()
+
+    # Written while archived: lands in the default partition
+    db.add(PlayerStats(nfl_player_id=1, week_number=2, season_year=2022))
+    db.commit()
+
+    restore_season(db, 2022)
+    assert db.execute(text("SELECT count(*) FROM player_stats_2022")).scalar() == 2
+    assert db.execute(
+        text("SELECT count(*) FROM player_stats_default WHERE season_year = 2022")
+    ).scalar() == 0
+    assert db.execute(text(
+        "SELECT count(*) FROM information_schema.tables WHERE table_schema = 'archive'"
+    )).scalar() == 0